@@ -12,13 +12,13 @@ Fixes all quality issues found in Parts 1-3:
 import pandas as pd
 import re
 import os
-from datetime import datetime
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from data_io import load_raw
 
 # ── Load raw data ──────────────────────────────────────────────────────────────
-df = pd.read_csv("customers_raw.csv", dtype=str)
-df.columns = df.columns.str.strip()
-for col in df.columns:
-    df[col] = df[col].str.strip()
+df = load_raw()
 
 TOTAL_ROWS = len(df)
 
@@ -29,58 +29,28 @@ def add(text=""):
     report_lines.append(text)
     # print(text) # Suppressed as per user request
 
-def log_action(category, detail):
-    actions.append({"category": category, "detail": detail})
-
-def safe(val):
-    return "" if pd.isna(val) else str(val).strip()
-
 # ══════════════════════════════════════════════════════════════════════════════
 # CLEANING FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def normalize_phone(val):
-    """
-    Convert any phone format to XXX-XXX-XXXX.
-    Strips all non-digit characters, then reformats.
-    """
-    val = safe(val)
-    if not val:
-        return val
-    digits = re.sub(r"\D", "", val)  # keep digits only
-    if len(digits) == 10:
-        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
-    return val  # return as-is if we can't parse it
-
-def normalize_date(val):
+# Compiled once at module level; every column-wise match/replace reuses these.
+DIGITS_RE    = re.compile(r"\D")
+ISO_DATE_RE  = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+NAME_RE      = re.compile(r"^[A-Za-z\-']{2,50}$")
+EMAIL_RE     = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
+PHONE_STD_RE = re.compile(r"^\d{3}-\d{3}-\d{4}$")
+
+def normalize_date_column(series):
     """
-    Convert any recognizable date format to YYYY-MM-DD.
-    Returns original value if it can't be parsed (will be flagged).
+    Convert any recognizable date format in a column to YYYY-MM-DD.
+    Tries each known format with pd.to_datetime(errors="coerce") and keeps
+    the first parse that sticks; unparseable values stay as-is (flagged later).
     """
-    val = safe(val)
-    if not val:
-        return val
+    parsed = None
     for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y"):
-        try:
-            return datetime.strptime(val, fmt).strftime("%Y-%m-%d")
-        except:
-            pass
-    return val  # unparseable — leave as-is, will be flagged
-
-def normalize_name(val):
-    """Apply title case: 'PATRICIA' -> 'Patricia', 'johnson' -> 'Johnson'"""
-    val = safe(val)
-    return val.title() if val else val
-
-def normalize_email(val):
-    """Lowercase the email."""
-    val = safe(val)
-    return val.lower() if val else val
-
-def normalize_status(val):
-    """Lowercase the account status."""
-    val = safe(val)
-    return val.lower() if val else val
+        attempt = pd.to_datetime(series, format=fmt, errors="coerce")
+        parsed = attempt if parsed is None else parsed.fillna(attempt)
+    return parsed.dt.strftime("%Y-%m-%d").where(parsed.notna(), series)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # MISSING VALUE STRATEGY
@@ -101,78 +71,140 @@ MISSING_STRATEGY = {
 }
 
 # ══════════════════════════════════════════════════════════════════════════════
-# APPLY CLEANING — column by column
+# VALIDATION
+# (same rules from Part 3, inline here for self-contained script; run once on
+#  the raw data for the baseline and again after cleaning to confirm fixes)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def revalidate(df_check):
+    """Quick re-validation pass. Returns (pass_count, fail_count, failures)."""
+
+    def filled(col):
+        return df_check[col].fillna("")
+
+    def vname(col):
+        s = filled(col)
+        # placeholder is acceptable
+        return s.eq("") | s.eq("[UNKNOWN]") | s.str.match(NAME_RE)
+
+    def vdate(col):
+        s = filled(col)
+        # flagged values are not a format error
+        return s.isin(["", "[INVALID_DATE]"]) | s.str.match(ISO_DATE_RE)
+
+    row_ok = (
+        vname("first_name")
+        & vname("last_name")
+        & filled("email").str.match(EMAIL_RE)
+        & filled("phone").str.match(PHONE_STD_RE)
+        & vdate("date_of_birth")
+        & vdate("created_date")
+        & filled("account_status").str.lower()
+          .isin(["active", "inactive", "suspended", "unknown"])
+        & pd.to_numeric(filled("income"), errors="coerce").ge(0).fillna(False)
+    )
+    pass_count = int(row_ok.sum())
+    failures = [idx + 1 for idx in df_check.index[~row_ok]]
+    return pass_count, len(df_check) - pass_count, failures
+
+# ══════════════════════════════════════════════════════════════════════════════
+# APPLY CLEANING — whole columns at a time (vectorized, no per-row loop)
 # ══════════════════════════════════════════════════════════════════════════════
 
-cleaned = df.copy()
-phone_fixed = date_fixed = name_fixed = email_fixed = status_fixed = 0
+# Baseline validation must run before cleaning since df is mutated in place
+# below — no full-frame copy, so peak memory stays at one DataFrame.
+passes_before, fails_before, _ = revalidate(df)
+
+cleaned = df
 missing_filled = {col: 0 for col in MISSING_STRATEGY}
 
-for idx in range(len(cleaned)):
-    row = cleaned.iloc[idx]
-
-    # ── Phone normalization ───────────────────────────────────────────────────
-    original_phone = safe(row["phone"])
-    new_phone = normalize_phone(original_phone)
-    if original_phone and new_phone != original_phone:
-        cleaned.at[idx, "phone"] = new_phone
-        phone_fixed += 1
-        log_action("Phone normalization",
-                   f"Row {idx+1}: '{original_phone}' -> '{new_phone}'")
-
-    # ── Date of birth normalization ───────────────────────────────────────────
-    original_dob = safe(row["date_of_birth"])
-    new_dob = normalize_date(original_dob)
-    if original_dob and new_dob != original_dob and new_dob != "[INVALID_DATE]":
-        cleaned.at[idx, "date_of_birth"] = new_dob
-        date_fixed += 1
-        log_action("Date normalization (date_of_birth)",
-                   f"Row {idx+1}: '{original_dob}' -> '{new_dob}'")
-    elif original_dob in ("invalid_date",) or (original_dob and new_dob == original_dob and not re.match(r"^\d{4}-\d{2}-\d{2}$", original_dob)):
-        cleaned.at[idx, "date_of_birth"] = "[INVALID_DATE]"
-        log_action("Invalid date flagged (date_of_birth)",
-                   f"Row {idx+1}: '{original_dob}' -> '[INVALID_DATE]'")
-
-    # ── Created date normalization ────────────────────────────────────────────
-    original_cd = safe(row["created_date"])
-    new_cd = normalize_date(original_cd)
-    if original_cd and new_cd != original_cd:
-        cleaned.at[idx, "created_date"] = new_cd
-        date_fixed += 1
-        log_action("Date normalization (created_date)",
-                   f"Row {idx+1}: '{original_cd}' -> '{new_cd}'")
-    elif original_cd == "invalid_date":
-        cleaned.at[idx, "created_date"] = "[INVALID_DATE]"
-        log_action("Invalid date flagged (created_date)",
-                   f"Row {idx+1}: '{original_cd}' -> '[INVALID_DATE]'")
-
-    # ── Name title case ───────────────────────────────────────────────────────
-    for name_col in ["first_name", "last_name"]:
-        original_name = safe(row[name_col])
-        new_name = normalize_name(original_name)
-        if original_name and new_name != original_name:
-            cleaned.at[idx, name_col] = new_name
-            name_fixed += 1
-            log_action(f"Name case ({name_col})",
-                       f"Row {idx+1}: '{original_name}' -> '{new_name}'")
-
-    # ── Email lowercase ───────────────────────────────────────────────────────
-    original_email = safe(row["email"])
-    new_email = normalize_email(original_email)
-    if original_email and new_email != original_email:
-        cleaned.at[idx, "email"] = new_email
-        email_fixed += 1
-        log_action("Email lowercase",
-                   f"Row {idx+1}: '{original_email}' -> '{new_email}'")
-
-    # ── Account status lowercase ──────────────────────────────────────────────
-    original_status = safe(row["account_status"])
-    new_status = normalize_status(original_status)
-    if original_status and new_status != original_status:
-        cleaned.at[idx, "account_status"] = new_status
-        status_fixed += 1
-        log_action("Status normalization",
-                   f"Row {idx+1}: '{original_status}' -> '{new_status}'")
+# Keep the pre-clean values so we can diff, count, and log every change.
+originals = {col: cleaned[col].fillna("") for col in cleaned.columns}
+
+# Each transform touches exactly one column, so they are independent and can
+# run concurrently: the Arrow/NumPy string kernels release the GIL, letting
+# threads overlap the column scans without any pickling cost.
+
+def clean_phone(orig):
+    """Strip non-digits in one regex pass, then rebuild XXX-XXX-XXXX by
+    slicing; anything that isn't 10 digits is left as-is."""
+    digits = orig.str.replace(DIGITS_RE, "", regex=True)
+    ten_digits = digits.str.len().eq(10)
+    new = (digits.str[:3] + "-" + digits.str[3:6]
+           + "-" + digits.str[6:]).where(ten_digits, orig)
+    return new, orig.ne("") & new.ne(orig)
+
+def clean_dob(orig):
+    """Normalize date_of_birth; unfixable values get flagged for review."""
+    new = normalize_date_column(orig)
+    normalized = orig.ne("") & new.ne(orig)
+    flagged = orig.ne("") & new.eq(orig) & ~orig.str.match(ISO_DATE_RE)
+    return new.where(~flagged, "[INVALID_DATE]"), normalized, flagged
+
+def clean_created(orig):
+    """Normalize created_date; literal 'invalid_date' gets flagged."""
+    new = normalize_date_column(orig)
+    normalized = orig.ne("") & new.ne(orig)
+    flagged = ~normalized & orig.eq("invalid_date")
+    return new.where(~flagged, "[INVALID_DATE]"), normalized, flagged
+
+def clean_title(orig):
+    new = orig.str.title()
+    return new, orig.ne("") & new.ne(orig)
+
+def clean_lower(orig):
+    new = orig.str.lower()
+    return new, orig.ne("") & new.ne(orig)
+
+transforms = {
+    "phone":          clean_phone,
+    "date_of_birth":  clean_dob,
+    "created_date":   clean_created,
+    "first_name":     clean_title,
+    "last_name":      clean_title,
+    "email":          clean_lower,
+    "account_status": clean_lower,
+}
+
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    futures = {col: ex.submit(fn, originals[col]) for col, fn in transforms.items()}
+    results = {col: f.result() for col, f in futures.items()}
+
+for col in transforms:
+    cleaned[col] = results[col][0]
+
+phone_changed = results["phone"][1]
+_, dob_normalized, dob_flagged = results["date_of_birth"]
+_, cd_normalized, cd_flagged = results["created_date"]
+name_changed = {col: results[col][1] for col in ["first_name", "last_name"]}
+email_changed = results["email"][1]
+status_changed = results["account_status"][1]
+
+# ── Change counters (vectorized sums instead of per-row increments) ───────────
+phone_fixed  = int(phone_changed.sum())
+date_fixed   = int(dob_normalized.sum() + cd_normalized.sum())
+name_fixed   = int(sum(m.sum() for m in name_changed.values()))
+email_fixed  = int(email_changed.sum())
+status_fixed = int(status_changed.sum())
+
+# ── Action log: one bulk extend per transform, built from the change masks ────
+change_sets = [
+    ("Phone normalization",                  phone_changed,              originals["phone"],          cleaned["phone"]),
+    ("Date normalization (date_of_birth)",   dob_normalized,             originals["date_of_birth"],  cleaned["date_of_birth"]),
+    ("Invalid date flagged (date_of_birth)", dob_flagged,                originals["date_of_birth"],  cleaned["date_of_birth"]),
+    ("Date normalization (created_date)",    cd_normalized,              originals["created_date"],   cleaned["created_date"]),
+    ("Invalid date flagged (created_date)",  cd_flagged,                 originals["created_date"],   cleaned["created_date"]),
+    ("Name case (first_name)",               name_changed["first_name"], originals["first_name"],     cleaned["first_name"]),
+    ("Name case (last_name)",                name_changed["last_name"],  originals["last_name"],      cleaned["last_name"]),
+    ("Email lowercase",                      email_changed,              originals["email"],          cleaned["email"]),
+    ("Status normalization",                 status_changed,             originals["account_status"], cleaned["account_status"]),
+]
+for category, mask, before, after in change_sets:
+    actions.extend(
+        {"category": category, "detail": f"Row {r}: '{o}' -> '{n}'"}
+        for r, o, n in zip((cleaned.index[mask] + 1).tolist(),
+                           before[mask].tolist(), after[mask].tolist())
+    )
 
 # ── Fill missing values ───────────────────────────────────────────────────────
 for col, fill_val in MISSING_STRATEGY.items():
@@ -181,64 +213,11 @@ for col, fill_val in MISSING_STRATEGY.items():
     if count > 0:
         cleaned.loc[mask, col] = fill_val
         missing_filled[col] = int(count)
-        for idx in cleaned[mask].index:
-            log_action(f"Missing value filled ({col})",
-                       f"Row {idx+1}: empty -> '{fill_val}'")
+        actions.extend({"category": f"Missing value filled ({col})",
+                        "detail": f"Row {r}: empty -> '{fill_val}'"}
+                       for r in (cleaned.index[mask] + 1).tolist())
 
-# ══════════════════════════════════════════════════════════════════════════════
-# RE-RUN VALIDATION on cleaned data
-# (same rules from Part 3, inline here for self-contained script)
-# ══════════════════════════════════════════════════════════════════════════════
-
-def revalidate(df_check):
-    """Quick re-validation pass. Returns (pass_count, fail_count, failures)."""
-    failures = []
-
-    def vname(v, field):
-        v = safe(v)
-        if not v or v == "[UNKNOWN]": return True   # placeholder is acceptable
-        return bool(re.match(r"^[A-Za-z\-']{2,50}$", v))
-
-    def vemail(v):
-        v = safe(v)
-        return bool(re.match(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$", v))
-
-    def vphone(v):
-        return bool(re.match(r"^\d{3}-\d{3}-\d{4}$", safe(v)))
-
-    def vdate(v):
-        v = safe(v)
-        if v in ("[INVALID_DATE]", ""): return True   # flagged — not a format error
-        return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", v))
-
-    def vstatus(v):
-        return safe(v).lower() in {"active", "inactive", "suspended", "unknown"}
-
-    def vincome(v):
-        v = safe(v)
-        try: return float(v) >= 0
-        except: return False
-
-    pass_count = 0
-    for idx, row in df_check.iterrows():
-        row_ok = all([
-            vname(row["first_name"], "first_name"),
-            vname(row["last_name"], "last_name"),
-            vemail(row["email"]),
-            vphone(row["phone"]),
-            vdate(row["date_of_birth"]),
-            vdate(row["created_date"]),
-            vstatus(row["account_status"]),
-            vincome(row["income"]),
-        ])
-        if row_ok:
-            pass_count += 1
-        else:
-            failures.append(idx + 1)
-    return pass_count, len(df_check) - pass_count, failures
-
-passes_before, fails_before, _ = revalidate(df)
-passes_after,  fails_after, remaining_failures = revalidate(cleaned)
+passes_after, fails_after, remaining_failures = revalidate(cleaned)
 
 # ══════════════════════════════════════════════════════════════════════════════
 # BUILD REPORT
@@ -310,8 +289,8 @@ with open("outputs/cleaning_log.txt", "w", encoding="utf-8") as f:
     f.write("\n".join(report_lines))
 
 cleaned.to_csv("outputs/customers_cleaned.csv", index=False)
-# Local copy for convenience
-cleaned.to_csv("customers_cleaned.csv", index=False)
+# Local copy for convenience — a file copy, not a second CSV serialization
+shutil.copyfile("outputs/customers_cleaned.csv", "customers_cleaned.csv")
 
 print("\nSaved: outputs/cleaning_log.txt")
 print("Saved: outputs/customers_cleaned.csv")
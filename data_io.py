@@ -0,0 +1,43 @@
+"""
+Shared Data Loading
+Reads customers_raw.csv once per process and hands the cached frame to every
+script that needs it, so a pipeline run doesn't pay the CSV parse twice.
+"""
+
+import pandas as pd
+from functools import lru_cache
+
+# Arrow-backed strings keep columns in contiguous UTF-8 buffers and run the
+# .str kernels in native code; fall back to pandas' default string dtype.
+# Note: the C parser must be kept — engine="pyarrow" type-infers columns
+# before the string cast, rewriting raw values ("007" -> "7", "1e5" ->
+# "100000.0"), and we need to see the raw text.
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = str
+
+
+def strip_if_needed(series):
+    """Strip a string column, keeping the original buffer when it is
+    already clean (common on pipeline re-runs over cleaned files)."""
+    stripped = series.str.strip()
+    return series if stripped.equals(series) else stripped
+
+
+@lru_cache(maxsize=1)
+def _read_raw(path):
+    # One column-wise strip pass instead of a per-column Python loop
+    return (pd.read_csv(path, dtype=STRING_DTYPE)
+            .rename(columns=str.strip)
+            .apply(strip_if_needed))
+
+
+def load_raw(path="customers_raw.csv"):
+    """
+    Load the raw customer CSV, parsed at most once per process.
+    Returns a shallow copy so callers can mutate their frame without
+    touching the cached one (pandas copy-on-write keeps this cheap).
+    """
+    return _read_raw(path).copy(deep=False)
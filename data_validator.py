@@ -9,11 +9,10 @@ import re
 import os
 from datetime import datetime
 
+from data_io import load_raw
+
 # ── Load Data ──────────────────────────────────────────────────────────────────
-df = pd.read_csv("customers_raw.csv", dtype=str)
-df.columns = df.columns.str.strip()
-for col in df.columns:
-    df[col] = df[col].str.strip()
+df = load_raw()
 
 TOTAL_ROWS = len(df)
 
@@ -31,9 +30,16 @@ def safe(val):
     """Return empty string if NaN, else stripped string."""
     return "" if pd.isna(val) else str(val).strip()
 
+# ── Compiled patterns (hoisted so no rule recompiles per call) ────────────────
+
+NAME_RE      = re.compile(r"^[A-Za-z\-']+$")
+EMAIL_RE     = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
+PHONE_ANY_RE = re.compile(r"^(\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4})$")
+PHONE_STD_RE = re.compile(r"^\d{3}-\d{3}-\d{4}$")
+
 # ── Rule definitions ──────────────────────────────────────────────────────────
 
-def validate_customer_id(val, all_ids):
+def validate_customer_id(val, is_duplicate):
     val = safe(val)
     if not val:
         return False, "Empty customer_id"
@@ -43,7 +49,7 @@ def validate_customer_id(val, all_ids):
             return False, f"customer_id must be positive, got {n}"
     except:
         return False, f"customer_id must be an integer, got '{val}'"
-    if all_ids.count(val) > 1:
+    if is_duplicate:
         return False, f"Duplicate customer_id: {val}"
     return True, "OK"
 
@@ -55,7 +61,7 @@ def validate_name(val, field):
         return False, f"{field} too short (min 2 chars): '{val}'"
     if len(val) > 50:
         return False, f"{field} too long (max 50 chars): '{val}'"
-    if not re.match(r"^[A-Za-z\-']+$", val):
+    if not NAME_RE.match(val):
         return False, f"{field} contains non-alphabetic characters: '{val}'"
     return True, "OK"
 
@@ -63,8 +69,7 @@ def validate_email(val):
     val = safe(val)
     if not val:
         return False, "Email is empty"
-    pattern = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
-    if not pattern.match(val):
+    if not EMAIL_RE.match(val):
         return False, f"Invalid email format: '{val}'"
     return True, "OK"
 
@@ -73,11 +78,9 @@ def validate_phone(val):
     if not val:
         return False, "Phone is empty"
     # Accept any of the formats seen in the data — we flag non-standard ones
-    pattern = re.compile(r"^(\(?\d{3}\)?[\s.\-]?\d{3}[\s.\-]?\d{4})$")
-    if not pattern.match(val):
+    if not PHONE_ANY_RE.match(val):
         return False, f"Unrecognizable phone format: '{val}'"
-    standard = re.compile(r"^\d{3}-\d{3}-\d{4}$")
-    if not standard.match(val):
+    if not PHONE_STD_RE.match(val):
         return False, f"Non-standard phone format (expected XXX-XXX-XXXX): '{val}'"
     return True, "OK"
 
@@ -150,41 +153,84 @@ def validate_account_status(val):
 # RUN VALIDATION
 # ══════════════════════════════════════════════════════════════════════════════
 
-# Collect all customer_ids for uniqueness check
-all_ids = df["customer_id"].tolist()
+# Uniqueness check: one hash-based pass instead of list.count per row (O(N²))
+dup_mask = df["customer_id"].duplicated(keep=False).to_numpy()
+
+# ── Vectorized fast-path masks ────────────────────────────────────────────────
+# Each pure-format rule is evaluated once over the whole column with
+# Series.str.match / pd.to_datetime instead of N re.match calls. The scalar
+# validators above are only re-run on failing cells to build the exact
+# per-failure reason strings for the report.
+def _filled(col):
+    return df[col].fillna("")
+
+format_ok = {
+    "first_name":   _filled("first_name").str.match(NAME_RE)
+                    & _filled("first_name").str.len().between(2, 50),
+    "last_name":    _filled("last_name").str.match(NAME_RE)
+                    & _filled("last_name").str.len().between(2, 50),
+    "email":        _filled("email").str.match(EMAIL_RE),
+    "phone":        _filled("phone").str.match(PHONE_STD_RE),
+    "created_date": pd.to_datetime(_filled("created_date"), format="%Y-%m-%d",
+                                   errors="coerce").notna(),
+    "account_status": _filled("account_status").str.lower()
+                      .isin(["active", "inactive", "suspended"]),
+}
+
+# income: one C-level numeric parse instead of per-row float() + try/except
+_income_num = pd.to_numeric(df["income"], errors="coerce")
+format_ok["income"] = _income_num.notna() & _income_num.between(0, 10_000_000)
+
+# date_of_birth: parse once, compute all ages with datetime64 arithmetic
+_dob_parsed = pd.to_datetime(_filled("date_of_birth"), format="%Y-%m-%d",
+                             errors="coerce")
+_dob_age = (pd.Timestamp.now() - _dob_parsed).dt.days / 365.25
+format_ok["date_of_birth"] = _dob_parsed.notna() & _dob_age.between(18, 120)
+format_ok = {col: mask.to_numpy() for col, mask in format_ok.items()}
+
+OK = (True, "OK")
 
 # failures[col] = list of {row, value, reason}
 failures = {col: [] for col in df.columns}
 row_pass_fail = []  # True/False per row
 
-for idx, row in df.iterrows():
-    row_num = idx + 1  # human-readable (1-indexed)
-    row_failed = False
+# itertuples avoids the per-row Series construction that iterrows pays
+for i, row in enumerate(df.itertuples(index=False)):
+    row_num = i + 1  # human-readable (1-indexed)
 
     def run_check(col, result):
         passed, reason = result
         if not passed:
             failures[col].append({
                 "row": row_num,
-                "customer_id": safe(row.get("customer_id")),
-                "value": safe(row.get(col)),
+                "customer_id": safe(getattr(row, "customer_id", "")),
+                "value": safe(getattr(row, col, "")),
                 "reason": reason
             })
         return passed
 
-    checks = [
-        run_check("customer_id",    validate_customer_id(row["customer_id"], all_ids)),
-        run_check("first_name",     validate_name(row["first_name"], "first_name")),
-        run_check("last_name",      validate_name(row["last_name"], "last_name")),
-        run_check("email",          validate_email(row["email"])),
-        run_check("phone",          validate_phone(row["phone"])),
-        run_check("date_of_birth",  validate_date_of_birth(row["date_of_birth"])),
-        run_check("address",        validate_address(row["address"])),
-        run_check("income",         validate_income(row["income"])),
-        run_check("account_status", validate_account_status(row["account_status"])),
-        run_check("created_date",   validate_date(row["created_date"], "created_date")),
-    ]
-    row_failed = not all(checks)
+    # Every rule still runs (the report records all failures per row, so an
+    # early exit would drop entries) — but without the 10-element list that
+    # the old all([...]) pattern allocated each iteration.
+    ok = run_check("customer_id",     validate_customer_id(row.customer_id, dup_mask[i]))
+    ok &= run_check("first_name",     OK if format_ok["first_name"][i]
+                                      else validate_name(row.first_name, "first_name"))
+    ok &= run_check("last_name",      OK if format_ok["last_name"][i]
+                                      else validate_name(row.last_name, "last_name"))
+    ok &= run_check("email",          OK if format_ok["email"][i]
+                                      else validate_email(row.email))
+    ok &= run_check("phone",          OK if format_ok["phone"][i]
+                                      else validate_phone(row.phone))
+    ok &= run_check("date_of_birth",  OK if format_ok["date_of_birth"][i]
+                                      else validate_date_of_birth(row.date_of_birth))
+    ok &= run_check("address",        validate_address(row.address))
+    ok &= run_check("income",         OK if format_ok["income"][i]
+                                      else validate_income(row.income))
+    ok &= run_check("account_status", OK if format_ok["account_status"][i]
+                                      else validate_account_status(row.account_status))
+    ok &= run_check("created_date",   OK if format_ok["created_date"][i]
+                                      else validate_date(row.created_date, "created_date"))
+    row_failed = not ok
 
     row_pass_fail.append(not row_failed)
 
@@ -4,21 +4,29 @@ Scans the raw customer data for personally identifiable information (PII),
 quantifies exposure risk, and generates a PII detection report.
 """
 
-import pandas as pd
+import numpy as np
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from data_io import load_raw
 
 # ── Load Data ──────────────────────────────────────────────────────────────────
-df = pd.read_csv("customers_raw.csv", dtype=str)
-df.columns = df.columns.str.strip()
-for col in df.columns:
-    df[col] = df[col].str.strip()
+# Missing values are blanked once here; every detector and mask below can
+# then treat the frame as all-string with no per-cell NA handling.
+df = load_raw().fillna("")
 
 TOTAL_ROWS = len(df)
 
-report_lines = []
+Path("outputs").mkdir(parents=True, exist_ok=True)
+_REPORT_FP = open("outputs/pii_detection_report.txt", "w",
+                  encoding="utf-8", buffering=1 << 20)
 def add(text=""):
-    report_lines.append(text)
+    # Lines go straight into the buffered report file, so the report never
+    # sits in memory a second time before the save step
+    _REPORT_FP.write(text)
+    _REPORT_FP.write("\n")
     # print(text)  # Suppressed as per user request
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -62,77 +70,71 @@ PII_COLUMNS = {
 # DETECTION FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _matching_rows(series, pattern):
+    """Match `pattern` against the whole column at once (NaN never matches)
+    and return the hits as two aligned arrays: 1-based row numbers and the
+    matching values. Parallel arrays instead of per-row dicts keep the
+    results compact and cheap to slice for the report."""
+    mask = series.str.match(pattern, na=False)
+    hits = np.flatnonzero(mask.to_numpy())
+    return hits + 1, series.to_numpy()[hits]
+
 def detect_emails(series):
     """Find rows where the value looks like a valid email."""
-    found = []
-    for idx, val in series.items():
-        if pd.notna(val) and PATTERNS["email"].match(str(val)):
-            found.append({"row": idx + 1, "value": val})
-    return found
+    return _matching_rows(series, PATTERNS["email"])
 
 def detect_phones(series):
     """Find rows where the value looks like a phone number."""
-    found = []
-    for idx, val in series.items():
-        if pd.notna(val) and PATTERNS["phone"].match(str(val)):
-            found.append({"row": idx + 1, "value": val})
-    return found
+    return _matching_rows(series, PATTERNS["phone"])
 
 def detect_addresses(series):
     """Find rows where the value looks like a street address."""
-    found = []
-    for idx, val in series.items():
-        if pd.notna(val) and val.strip() != "" and PATTERNS["address"].match(str(val)):
-            found.append({"row": idx + 1, "value": val})
-    return found
+    return _matching_rows(series, PATTERNS["address"])
 
 def detect_dates_of_birth(series):
     """Find rows with a parseable date of birth."""
-    found = []
-    for idx, val in series.items():
-        if pd.notna(val) and PATTERNS["date"].match(str(val).strip()):
-            found.append({"row": idx + 1, "value": val})
-    return found
+    return _matching_rows(series, PATTERNS["date"])
 
 def detect_names(series):
     """Find rows with a non-empty name."""
-    found = []
-    for idx, val in series.items():
-        if pd.notna(val) and val.strip() != "" and PATTERNS["name"].match(str(val).strip()):
-            found.append({"row": idx + 1, "value": val})
-    return found
+    return _matching_rows(series, PATTERNS["name"])
 
 # ── Run detectors ─────────────────────────────────────────────────────────────
-detected = {
-    "first_name":    detect_names(df["first_name"]),
-    "last_name":     detect_names(df["last_name"]),
-    "email":         detect_emails(df["email"]),
-    "phone":         detect_phones(df["phone"]),
-    "address":       detect_addresses(df["address"]),
-    "date_of_birth": detect_dates_of_birth(df["date_of_birth"]),
+# Columns are independent, so the scans run on a thread pool; the string
+# match kernels release the GIL, letting the columns overlap on real cores.
+DETECTORS = {
+    "first_name":    detect_names,
+    "last_name":     detect_names,
+    "email":         detect_emails,
+    "phone":         detect_phones,
+    "address":       detect_addresses,
+    "date_of_birth": detect_dates_of_birth,
 }
 
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    futures = {col: ex.submit(fn, df[col]) for col, fn in DETECTORS.items()}
+    detected = {col: future.result() for col, future in futures.items()}
+
 # ── Rows with COMBINED PII (most dangerous) ───────────────────────────────────
-# A row is "fully exposed" if it has name + email + phone + address + DOB
-fully_exposed = []
-for idx, row in df.iterrows():
-    def safe(v): return str(v).strip() if pd.notna(v) else ""
-    fn = safe(row.get("first_name")); ln = safe(row.get("last_name"))
-    has_name    = bool(fn) and bool(ln)
-    has_email   = bool(safe(row.get("email"))) and bool(PATTERNS["email"].match(safe(row.get("email"))))
-    has_phone   = bool(safe(row.get("phone"))) and bool(PATTERNS["phone"].match(safe(row.get("phone"))))
-    has_address = bool(safe(row.get("address"))) and bool(PATTERNS["address"].match(safe(row.get("address"))))
-    has_dob     = bool(safe(row.get("date_of_birth"))) and bool(PATTERNS["date"].match(safe(row.get("date_of_birth"))))
-
-    pii_count = sum([has_name, has_email, has_phone, has_address, has_dob])
-    fully_exposed.append({
-        "customer_id": row["customer_id"],
-        "pii_fields": pii_count,
-        "fully_exposed": pii_count == 5
-    })
-
-fully_exposed_count = sum(1 for r in fully_exposed if r["fully_exposed"])
-partial_exposure_count = sum(1 for r in fully_exposed if 0 < r["pii_fields"] < 5)
+# A row is "fully exposed" if it has name + email + phone + address + DOB.
+# Each condition is one whole-column mask (the match patterns all require
+# content, so a match implies non-empty) instead of five regex calls per row.
+has_name    = (df["first_name"].ne("") & df["last_name"].ne("")).to_numpy()
+has_email   = df["email"].str.match(PATTERNS["email"], na=False).to_numpy()
+has_phone   = df["phone"].str.match(PATTERNS["phone"], na=False).to_numpy()
+has_address = df["address"].str.match(PATTERNS["address"], na=False).to_numpy()
+has_dob     = df["date_of_birth"].str.match(PATTERNS["date"], na=False).to_numpy()
+
+pii_count = (has_name.astype(np.int8) + has_email + has_phone
+             + has_address + has_dob)
+
+# SoA layout: three aligned arrays instead of a list of per-row dicts
+customer_id_arr    = df["customer_id"].to_numpy()
+pii_fields_arr     = pii_count
+fully_exposed_mask = pii_count == 5
+
+fully_exposed_count = int(fully_exposed_mask.sum())
+partial_exposure_count = int(((pii_count > 0) & ~fully_exposed_mask).sum())
 
 # ══════════════════════════════════════════════════════════════════════════════
 # BUILD REPORT
@@ -164,17 +166,16 @@ add()
 # ── Detection Counts ──────────────────────────────────────────────────────────
 add("DETECTED PII (by column):")
 add("-" * 40)
-for col, results in detected.items():
-    pct = round(len(results) / TOTAL_ROWS * 100)
-    add(f"  - {col}: {len(results)}/{TOTAL_ROWS} rows ({pct}%) contain PII")
+for col, (rows, values) in detected.items():
+    pct = round(len(rows) / TOTAL_ROWS * 100)
+    add(f"  - {col}: {len(rows)}/{TOTAL_ROWS} rows ({pct}%) contain PII")
 add()
 
 # ── Sample PII values ─────────────────────────────────────────────────────────
 add("SAMPLE DETECTED VALUES (first 3 per column):")
 add("-" * 40)
-for col, results in detected.items():
-    samples = [r["value"] for r in results[:3]]
-    add(f"  {col}: {samples}")
+for col, (rows, values) in detected.items():
+    add(f"  {col}: {values[:3].tolist()}")
 add()
 
 # ── Regex Pattern Breakdown ───────────────────────────────────────────────────
@@ -211,9 +212,10 @@ add("PER-ROW EXPOSURE BREAKDOWN:")
 add("-" * 40)
 add(f"  {'customer_id':<15} {'PII Fields':>12} {'Risk Level':>12}")
 add(f"  {'-'*15} {'-'*12} {'-'*12}")
-for r in fully_exposed:
-    level = "CRITICAL" if r["pii_fields"] == 5 else ("HIGH" if r["pii_fields"] >= 3 else "LOW")
-    add(f"  {r['customer_id']:<15} {r['pii_fields']:>12} {level:>12}")
+levels = np.where(pii_fields_arr == 5, "CRITICAL",
+                  np.where(pii_fields_arr >= 3, "HIGH", "LOW"))
+for cid, n, level in zip(customer_id_arr, pii_fields_arr, levels):
+    add(f"  {cid:<15} {n:>12} {level:>12}")
 add()
 
 # ── Mitigation ────────────────────────────────────────────────────────────────
@@ -230,8 +232,6 @@ add("END OF REPORT")
 add("=" * 60)
 
 # ── Save ───────────────────────────────────────────────────────────────────────
-os.makedirs("outputs", exist_ok=True)
-with open("outputs/pii_detection_report.txt", "w", encoding="utf-8") as f:
-    f.write("\n".join(report_lines))
+_REPORT_FP.close()
 
 print("\nReport saved to outputs/pii_detection_report.txt")
@@ -11,25 +11,36 @@ Masking rules:
 
 import pandas as pd
 import os
+import shutil
+
+from data_io import STRING_DTYPE, strip_if_needed
 
 # ── Load cleaned data ─────────────────────────────────────────────────────────
+# Arrow-backed strings (when pyarrow is installed) keep the PII columns in
+# contiguous UTF-8 buffers, so the .str masking kernels below run in native
+# code instead of chasing per-cell Python objects.
 if os.path.exists("outputs/customers_cleaned.csv"):
-    df = pd.read_csv("outputs/customers_cleaned.csv", dtype=str)
+    df = pd.read_csv("outputs/customers_cleaned.csv", dtype=STRING_DTYPE)
 elif os.path.exists("customers_cleaned.csv"):
-    df = pd.read_csv("customers_cleaned.csv", dtype=str)
+    df = pd.read_csv("customers_cleaned.csv", dtype=STRING_DTYPE)
 else:
     # Fallback if both are missing
-    df = pd.read_csv("customers_raw.csv", dtype=str)
+    df = pd.read_csv("customers_raw.csv", dtype=STRING_DTYPE)
 
-df.columns = df.columns.str.strip()
-for col in df.columns:
-    df[col] = df[col].str.strip()
+# One column-wise strip pass; columns that are already clean (the usual
+# case, since the input comes from the cleaning step) keep their buffers
+df = df.rename(columns=str.strip).apply(strip_if_needed)
 
 TOTAL_ROWS = len(df)
 
-report_lines = []
+os.makedirs("outputs", exist_ok=True)
+_REPORT_FP = open("outputs/masked_sample.txt", "w",
+                  encoding="utf-8", buffering=1 << 20)
 def add(text=""):
-    report_lines.append(text)
+    # Lines stream straight into the buffered report file instead of
+    # accumulating in a list that gets joined and copied at save time
+    _REPORT_FP.write(text)
+    _REPORT_FP.write("\n")
     # print(text) # Suppressed as per user request
 
 def safe(val):
@@ -39,62 +50,65 @@ def safe(val):
 # MASKING FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def mask_name(val):
+# Each masker takes the whole column and applies its rule with .str kernels,
+# so masking runs one vectorized pass per column instead of a Python callback
+# per cell.
+
+def mask_name(series):
     """'John' -> 'J***'  |  '[UNKNOWN]' -> '[UNKNOWN]'"""
-    val = safe(val)
-    if not val or val == "[UNKNOWN]":
-        return val
-    return val[0] + "***"
+    s = series.fillna("")
+    return (s.str[0] + "***").where(~s.isin(["", "[UNKNOWN]"]), s)
 
-def mask_email(val):
+def mask_email(series):
     """'john.doe@gmail.com' -> 'j***@gmail.com'"""
-    val = safe(val)
-    if not val or "@" not in val:
-        return val
-    local, domain = val.split("@", 1)
-    return local[0] + "***@" + domain
+    s = series.fillna("")
+    parts = s.str.split("@", n=1)
+    local, domain = parts.str[0], parts.str[1]
+    has_at = s.str.contains("@", regex=False)
+    return (local.str[0] + "***@" + domain).where(has_at, s)
 
-def mask_phone(val):
+def mask_phone(series):
     """'555-123-4567' -> '***-***-4567'"""
-    val = safe(val)
-    if not val:
-        return val
+    s = series.fillna("")
     # Keep last 4 digits only
-    parts = val.split("-")
-    if len(parts) == 3:
-        return f"***-***-{parts[2]}"
+    three_parts = s.str.count("-").eq(2)
+    standard = "***-***-" + s.str.split("-").str[2].fillna("")
     # Fallback for any unexpected format
-    return "***-***-" + val[-4:] if len(val) >= 4 else "***"
+    fallback = ("***-***-" + s.str[-4:]).where(s.str.len().ge(4), "***")
+    return standard.where(three_parts, fallback).where(s.ne(""), s)
 
-def mask_address(val):
+def mask_address(series):
     """'123 Main St New York NY 10001' -> '[MASKED ADDRESS]'"""
-    val = safe(val)
-    if not val or val == "[UNKNOWN]":
-        return val
-    return "[MASKED ADDRESS]"
+    s = series.fillna("")
+    return s.where(s.isin(["", "[UNKNOWN]"]), "[MASKED ADDRESS]")
 
-def mask_dob(val):
+def mask_dob(series):
     """'1985-03-15' -> '1985-**-**'  |  '[INVALID_DATE]' -> '[INVALID_DATE]'"""
-    val = safe(val)
-    if not val or val == "[INVALID_DATE]":
-        return val
-    parts = val.split("-")
-    if len(parts) == 3:
-        return f"{parts[0]}-**-**"
-    return "****-**-**"
+    s = series.fillna("")
+    three_parts = s.str.count("-").eq(2)
+    masked_dob = (s.str.split("-").str[0].fillna("") + "-**-**").where(
+        three_parts, "****-**-**")
+    return masked_dob.where(~s.isin(["", "[INVALID_DATE]"]), s)
+
+def mask_example(fn, value):
+    """Run a column masker on one value (for the report's examples table)."""
+    return fn(pd.Series([value])).iloc[0]
 
 # ══════════════════════════════════════════════════════════════════════════════
 # APPLY MASKING
 # ══════════════════════════════════════════════════════════════════════════════
 
-masked = df.copy()
-
-masked["first_name"]    = df["first_name"].apply(mask_name)
-masked["last_name"]     = df["last_name"].apply(mask_name)
-masked["email"]         = df["email"].apply(mask_email)
-masked["phone"]         = df["phone"].apply(mask_phone)
-masked["address"]       = df["address"].apply(mask_address)
-masked["date_of_birth"] = df["date_of_birth"].apply(mask_dob)
+# Shallow copy: the six masked columns are replaced wholesale below and
+# copy-on-write isolates those writes, so the untouched columns share
+# their buffers with `df` instead of being memcpy'd
+masked = df.copy(deep=False)
+
+masked["first_name"]    = mask_name(df["first_name"])
+masked["last_name"]     = mask_name(df["last_name"])
+masked["email"]         = mask_email(df["email"])
+masked["phone"]         = mask_phone(df["phone"])
+masked["address"]       = mask_address(df["address"])
+masked["date_of_birth"] = mask_dob(df["date_of_birth"])
 # income, account_status, created_date, customer_id — NOT masked (business data)
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -106,21 +120,26 @@ add("=" * 60)
 add()
 
 # ── Before / After for first 3 rows ──────────────────────────────────────────
+# Header and divider are identical for every table over the same columns,
+# so build them once instead of re-joining per table
+cols = list(df.columns)
+TABLE_HEADER  = "  " + " | ".join(f"{c:<22}" for c in cols)
+TABLE_DIVIDER = "  " + "-" * (25 * len(cols))
+
 add("BEFORE MASKING (first 3 rows):")
 add("-" * 60)
-cols = list(df.columns)
-add("  " + " | ".join(f"{c:<22}" for c in cols))
-add("  " + "-" * (25 * len(cols)))
-for _, row in df.head(3).iterrows():
-    add("  " + " | ".join(f"{safe(row[c]):<22}" for c in cols))
+add(TABLE_HEADER)
+add(TABLE_DIVIDER)
+for row in df.head(3).itertuples(index=False):
+    add("  " + " | ".join(f"{safe(v):<22}" for v in row))
 
 add()
 add("AFTER MASKING (first 3 rows):")
 add("-" * 60)
-add("  " + " | ".join(f"{c:<22}" for c in cols))
-add("  " + "-" * (25 * len(cols)))
-for _, row in masked.head(3).iterrows():
-    add("  " + " | ".join(f"{safe(row[c]):<22}" for c in cols))
+add(TABLE_HEADER)
+add(TABLE_DIVIDER)
+for row in masked.head(3).itertuples(index=False):
+    add("  " + " | ".join(f"{safe(v):<22}" for v in row))
 
 add()
 
@@ -129,12 +148,12 @@ add("MASKING RULES APPLIED (with examples):")
 add("-" * 60)
 
 mask_examples = [
-    ("first_name",    "John",                   mask_name("John"),                  "First letter only"),
-    ("last_name",     "Doe",                    mask_name("Doe"),                   "First letter only"),
-    ("email",         "john.doe@gmail.com",     mask_email("john.doe@gmail.com"),   "Local part hidden, domain kept"),
-    ("phone",         "555-123-4567",           mask_phone("555-123-4567"),         "Last 4 digits kept"),
-    ("address",       "123 Main St NY",         mask_address("123 Main St NY"),     "Fully replaced"),
-    ("date_of_birth", "1985-03-15",             mask_dob("1985-03-15"),             "Year kept, month/day hidden"),
+    ("first_name",    "John",                   mask_example(mask_name, "John"),                "First letter only"),
+    ("last_name",     "Doe",                    mask_example(mask_name, "Doe"),                 "First letter only"),
+    ("email",         "john.doe@gmail.com",     mask_example(mask_email, "john.doe@gmail.com"), "Local part hidden, domain kept"),
+    ("phone",         "555-123-4567",           mask_example(mask_phone, "555-123-4567"),       "Last 4 digits kept"),
+    ("address",       "123 Main St NY",         mask_example(mask_address, "123 Main St NY"),   "Fully replaced"),
+    ("date_of_birth", "1985-03-15",             mask_example(mask_dob, "1985-03-15"),           "Year kept, month/day hidden"),
     ("income",        "75000",                  "75000",                            "NOT masked (business data)"),
     ("account_status","active",                 "active",                           "NOT masked (business data)"),
     ("customer_id",   "1",                      "1",                                "NOT masked (internal key)"),
@@ -149,10 +168,14 @@ for col, before, after, reason in mask_examples:
 add("FULL MASKED DATASET (all 10 rows, key columns):")
 add("-" * 60)
 preview_cols = ["customer_id", "first_name", "last_name", "email", "phone", "date_of_birth", "income", "account_status"]
-add("  " + " | ".join(f"{c:<20}" for c in preview_cols))
-add("  " + "-" * (22 * len(preview_cols)))
-for _, row in masked.iterrows():
-    add("  " + " | ".join(f"{safe(row[c]):<20}" for c in preview_cols))
+PREVIEW_HEADER  = "  " + " | ".join(f"{c:<20}" for c in preview_cols)
+PREVIEW_DIVIDER = "  " + "-" * (22 * len(preview_cols))
+add(PREVIEW_HEADER)
+add(PREVIEW_DIVIDER)
+# One bulk conversion to a numpy array, then plain tuple iteration — no
+# per-row Series boxing like iterrows
+for row in masked[preview_cols].fillna("").to_numpy():
+    add("  " + " | ".join(f"{v:<20}" for v in row))
 
 add()
 
@@ -181,13 +204,11 @@ add("END OF REPORT")
 add("=" * 60)
 
 # ── Save outputs ───────────────────────────────────────────────────────────────
-os.makedirs("outputs", exist_ok=True)
-with open("outputs/masked_sample.txt", "w", encoding="utf-8") as f:
-    f.write("\n".join(report_lines))
+_REPORT_FP.close()
 
 masked.to_csv("outputs/customers_masked.csv", index=False)
-# Local copy for convenience
-masked.to_csv("customers_masked.csv", index=False)
+# Local copy for convenience — a byte copy, not a second CSV serialization
+shutil.copyfile("outputs/customers_masked.csv", "customers_masked.csv")
 
 print("\nSaved: outputs/masked_sample.txt")
 print("Saved: outputs/customers_masked.csv")